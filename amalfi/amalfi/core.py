@@ -84,9 +84,13 @@ def as_async[I, O](fn: Fn[I, O] | AsyncFn[I, O]) -> AsyncFn[I, O]:
     If the input function is already async, it will be returned as is.
     """
 
+    if inspect.iscoroutinefunction(fn):
+        return cast(AsyncFn[I, O], fn)
+
+    sync_fn = cast(Fn[I, O], fn)
+
     async def async_fn(x: I) -> O:
-        result = (await fn(x)) if inspect.iscoroutinefunction(fn) else fn(x)
-        return cast(O, result)
+        return sync_fn(x)
 
     return async_fn
 
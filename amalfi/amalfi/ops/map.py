@@ -1,5 +1,5 @@
 import asyncio
-from typing import Generator, Iterable, Literal, overload
+from typing import Iterable, Literal, overload
 
 from ..core import AsyncFn, AsyncIterFn, Fn, IterFn
 
@@ -28,27 +28,26 @@ def map_[I, O](fn: Fn[I, O]) -> IterFn[I, O]:
         [2, 4, 6]
     """
 
-    def mapper(iterable: Iterable[I]) -> Generator[O, None, None]:
-        for item in iterable:
-            yield fn(item)
+    def mapper(iterable: Iterable[I]) -> Iterable[O]:
+        return map(fn, iterable)
 
     return mapper
 
 
 @overload
 def amap[I, O](
-    fn: AsyncFn[I, O], *, safe: Literal[False] = False
+    fn: AsyncFn[I, O], *, safe: Literal[False] = False, limit: int | None = None
 ) -> AsyncIterFn[I, O]: ...
 
 
 @overload
 def amap[I, O](
-    fn: AsyncFn[I, O], *, safe: Literal[True]
+    fn: AsyncFn[I, O], *, safe: Literal[True], limit: int | None = None
 ) -> AsyncIterFn[I, O | BaseException]: ...
 
 
 def amap[I, O](
-    fn: AsyncFn[I, O], *, safe: bool = False
+    fn: AsyncFn[I, O], *, safe: bool = False, limit: int | None = None
 ) -> AsyncIterFn[I, O] | AsyncIterFn[I, O | BaseException]:
     """
     Apply an async function to each element of an iterable,
@@ -61,12 +60,15 @@ def amap[I, O](
         fn (AsyncFn[I, O]): An asynchronous mapping function
         safe (bool): If True, exceptions will be returned instead of raised.
             Analogous to the `return_exceptions` argument in `asyncio.gather`.
+        limit (int | None): The maximum number of calls to `fn` awaited at the
+            same time. If None, all the calls run concurrently.
 
     Returns:
         AsyncIterFn[I, O] | AsyncIterFn[I, O | BaseException]: the curried async mapper
         that returns a list of mapped values or exceptions
 
     Raises:
+        ValueError: If `limit` is lower than 1.
         Any exception raised by the async function `fn` will be propagated if
         `safe` is False.
 
@@ -87,11 +89,33 @@ def amap[I, O](
         >>> result = await amap_risky([1, 2, 3])
         >>> print(result)
         [2, ValueError("Two is not allowed"), 6]
+
+        >>> amap_double = amap(async_double, limit=2)  # at most 2 at a time
+        >>> await amap_double([1, 2, 3])
+        [2, 4, 6]
     """
 
-    async def async_map(
+    if limit is not None and limit < 1:
+        raise ValueError(f"Cannot run fewer than one call at a time: {limit}")
+
+    if limit is None:
+
+        async def async_map(
+            iterable: Iterable[I],
+        ) -> Iterable[O] | Iterable[O | BaseException]:
+            return await asyncio.gather(*map_(fn)(iterable), return_exceptions=safe)
+
+        return async_map
+
+    async def bounded_map(
         iterable: Iterable[I],
     ) -> Iterable[O] | Iterable[O | BaseException]:
-        return await asyncio.gather(*map_(fn)(iterable), return_exceptions=safe)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded_fn(value: I) -> O:
+            async with semaphore:
+                return await fn(value)
+
+        return await asyncio.gather(*map_(bounded_fn)(iterable), return_exceptions=safe)
 
-    return async_map
+    return bounded_map
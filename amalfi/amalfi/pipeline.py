@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import inspect
+from typing import Any, Callable, cast
+
 from .core import AsyncFn, Fn, as_async, identity
 
+type _Step = Callable[[Any], Any]
+"""A single, sync or async, step of a pipeline."""
+
 
 class Pipeline[I, O]:
     """
@@ -77,13 +83,51 @@ class Pipeline[I, O]:
     ```
     """
 
+    __slots__ = ("input", "_steps", "_fn")
+
     input: I
-    fn: Fn[I, O]
+    _steps: tuple[_Step, ...]
+    _fn: Fn[I, O] | None
 
     def __init__(self, input: I, fn: Fn[I, O] = identity):
         """Initialize the `Pipeline` with an input value and a function."""
         self.input = input
-        self.fn = fn
+        self._steps = () if fn is identity else (fn,)
+        self._fn = None
+
+    @property
+    def fn(self) -> Fn[I, O]:
+        """
+        The chained functions of the pipeline, composed into a single callable
+        the first time it is needed and cached afterwards.
+        """
+        if self._fn is None:
+            self._fn = _compose(self._steps)
+        return self._fn
+
+    @fn.setter
+    def fn(self, fn: Fn[I, O]) -> None:
+        """Replace the steps of the pipeline with a single function."""
+        self._steps = () if fn is identity else (fn,)
+        self._fn = None
+
+    def compile(self) -> Pipeline[I, O]:
+        """
+        Compile the steps of the pipeline into a single generated function that
+        calls them in sequence, with no loop over the steps, and use it as the
+        pipeline function. Meant for pipelines that are run many times, as the
+        code generation has a one-off cost.
+
+        Returns:
+            Pipeline[I, O]: The same pipeline, compiled.
+
+        Example:
+            >>> pipeline = (pipe(1) | add_one | double).compile()
+            >>> assert pipeline.run() == 4
+            >>> assert pipeline.with_input(2).run() == 6
+        """
+        self._fn = _codegen(self._steps)
+        return self
 
     def __call__(self) -> O:
         """Execute the pipeline on the stored input."""
@@ -93,6 +137,12 @@ class Pipeline[I, O]:
         """Execute the pipeline on the stored input."""
         return self.fn(self.input)
 
+    def _with_steps(self, steps: tuple[_Step, ...]) -> Pipeline[I, Any]:
+        """Return a new pipeline with the same input and the given steps."""
+        pipeline = Pipeline(self.input)
+        pipeline._steps = steps
+        return pipeline
+
     def step[U](self, fn: Fn[O, U]) -> Pipeline[I, U]:
         """
         Adds a function as a step to the pipeline.
@@ -101,10 +151,7 @@ class Pipeline[I, O]:
         function with the provided function `fn`.
         """
 
-        def composed_fn(value: I) -> U:
-            return fn(self.fn(value))
-
-        return Pipeline(self.input, composed_fn)
+        return self._with_steps((*self._steps, fn))
 
     def __or__[U](self, fn: Fn[O, U]) -> Pipeline[I, U]:
         """
@@ -126,10 +173,7 @@ class Pipeline[I, O]:
         other pipeline.
         """
 
-        def concat_fn(value: I) -> U:
-            return other.fn(self.fn(value))
-
-        return Pipeline(self.input, concat_fn)
+        return self._with_steps((*self._steps, *other._steps))
 
     def __gt__[U](self, other: Pipeline[O, U]) -> Pipeline[I, U]:
         """
@@ -139,8 +183,14 @@ class Pipeline[I, O]:
         return self.concat(other)
 
     def to_async(self) -> AsyncPipeline[I, O]:
-        """Convert the pipeline to an asynchronous pipeline."""
-        return AsyncPipeline(self.input, as_async(self.fn))
+        """
+        Convert the pipeline to an asynchronous pipeline.
+        The steps are carried over as they are, so they keep running as a single
+        sync stage, merged with any sync steps added afterwards.
+        """
+        pipeline = AsyncPipeline(self.input)
+        pipeline._steps = self._steps
+        return cast(AsyncPipeline[I, O], pipeline)
 
 
 def pipe[T](input: T, fn: Fn[T, T] | None = None) -> Pipeline[T, T]:
@@ -191,17 +241,55 @@ class AsyncPipeline[I, O]:
     ```
     """
 
-    value: I
-    fn: AsyncFn[I, O]
+    __slots__ = ("input", "_steps", "_fn")
+
+    input: I
+    _steps: tuple[_Step, ...]
+    _fn: AsyncFn[I, O] | None
 
     def __init__(self, input: I, fn: Fn[I, O] | AsyncFn[I, O] = identity):
         """
         Initialize the `AsyncPipeline` with an input value and a function.
-        If the function is not async, it will be wrapped in an async wrapper in
-        order to be able to chain it with other async functions.
+        The function can be sync or async: steps are stored as given and only
+        composed into a single async callable when the pipeline is first run.
         """
         self.input = input
-        self.fn = as_async(fn)
+        self._steps = () if fn is identity else (fn,)
+        self._fn = None
+
+    @property
+    def fn(self) -> AsyncFn[I, O]:
+        """
+        The chained functions of the pipeline, composed into a single async
+        callable the first time it is needed and cached afterwards.
+        """
+        if self._fn is None:
+            self._fn = _acompose(self._steps)
+        return self._fn
+
+    @fn.setter
+    def fn(self, fn: Fn[I, O] | AsyncFn[I, O]) -> None:
+        """Replace the steps of the pipeline with a single function."""
+        self._steps = () if fn is identity else (fn,)
+        self._fn = None
+
+    def compile(self) -> AsyncPipeline[I, O]:
+        """
+        Compile the steps of the pipeline into a single generated async function
+        that calls them in sequence, awaiting only the async ones, and use it as
+        the pipeline function. Meant for pipelines that are run many times, as
+        the code generation has a one-off cost.
+
+        Returns:
+            AsyncPipeline[I, O]: The same pipeline, compiled.
+
+        Example:
+            >>> pipeline = (apipe(1) | add_one | wait_and_double).compile()
+            >>> assert await pipeline.run() == 4
+            >>> assert await pipeline.with_input(2).run() == 6
+        """
+        self._fn = _codegen(self._steps, is_async=True)
+        return self
 
     async def __call__(self) -> O:
         """Execute the pipeline on the stored input."""
@@ -211,6 +299,12 @@ class AsyncPipeline[I, O]:
         """Execute the pipeline on the stored input."""
         return await self.fn(self.input)
 
+    def _with_steps(self, steps: tuple[_Step, ...]) -> AsyncPipeline[I, Any]:
+        """Return a new pipeline with the same input and the given steps."""
+        pipeline = AsyncPipeline(self.input)
+        pipeline._steps = steps
+        return pipeline
+
     def step[U](self, fn: Fn[O, U] | AsyncFn[O, U]) -> AsyncPipeline[I, U]:
         """
         Adds a function as a step to the pipeline.
@@ -220,10 +314,7 @@ class AsyncPipeline[I, O]:
         either sync or async.
         """
 
-        async def composed_fn(value: I) -> U:
-            return await as_async(fn)(await self.fn(value))
-
-        return AsyncPipeline(self.input, composed_fn)
+        return self._with_steps((*self._steps, fn))
 
     def __or__[U](self, fn: Fn[O, U] | AsyncFn[O, U]) -> AsyncPipeline[I, U]:
         """
@@ -244,10 +335,7 @@ class AsyncPipeline[I, O]:
         other pipeline.
         """
 
-        async def concat_fn(value: I) -> U:
-            return await other.fn(await self.fn(value))
-
-        return AsyncPipeline(self.input, concat_fn)
+        return self._with_steps((*self._steps, *other._steps))
 
     def __gt__[U](self, other: AsyncPipeline[O, U]) -> AsyncPipeline[I, U]:
         """
@@ -257,6 +345,75 @@ class AsyncPipeline[I, O]:
         return self.concat(other)
 
 
+def _compose(steps: tuple[_Step, ...]) -> _Step:
+    """Compose sync steps into a single callable applying them in order."""
+    if not steps:
+        return identity
+    if len(steps) == 1:
+        return steps[0]
+
+    def composed_fn(value: Any) -> Any:
+        for step in steps:
+            value = step(value)
+        return value
+
+    return composed_fn
+
+
+def _codegen(steps: tuple[_Step, ...], is_async: bool = False) -> Any:
+    """
+    Generate a function calling the steps in order, one statement per step,
+    eg. `x = f0(x); x = await f1(x); return x`, awaiting only the async steps
+    when `is_async` is set. The steps are bound as keyword-only defaults, so
+    that they are looked up as fast locals rather than globals.
+    """
+    names = [f"f{i}" for i in range(len(steps))]
+    body = "".join(
+        f"    x = await {name}(x)\n"
+        if is_async and inspect.iscoroutinefunction(step)
+        else f"    x = {name}(x)\n"
+        for name, step in zip(names, steps)
+    )
+    params = "".join(f", {name}={name}" for name in names)
+    header = "async def" if is_async else "def"
+    signature = f"x, *{params}" if params else "x"
+    namespace: dict[str, Any] = dict(zip(names, steps))
+    exec(f"{header} compiled_fn({signature}):\n{body}    return x\n", namespace)
+    return namespace["compiled_fn"]
+
+
+def _acompose(steps: tuple[_Step, ...]) -> AsyncFn[Any, Any]:
+    """
+    Compose sync and async steps into a single async callable applying them in
+    order. Consecutive sync steps are composed together, so that only the async
+    steps are awaited.
+    """
+    stages: list[tuple[bool, _Step]] = []
+    sync_steps: list[_Step] = []
+    for step in steps:
+        if inspect.iscoroutinefunction(step):
+            if sync_steps:
+                stages.append((False, _compose(tuple(sync_steps))))
+                sync_steps = []
+            stages.append((True, step))
+        else:
+            sync_steps.append(step)
+    if sync_steps:
+        stages.append((False, _compose(tuple(sync_steps))))
+
+    if not stages:
+        return as_async(identity)
+    if len(stages) == 1:
+        return as_async(stages[0][1])
+
+    async def composed_fn(value: Any) -> Any:
+        for is_async, stage in stages:
+            value = (await stage(value)) if is_async else stage(value)
+        return value
+
+    return composed_fn
+
+
 def apipe[T](
     input: T, fn: Fn[T, T] | AsyncFn[T, T] | None = None
 ) -> AsyncPipeline[T, T]:
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from typing import AsyncIterable, AsyncIterator, Iterable, overload
-
-from ..core import AsyncFn, Fn, as_async
+import inspect
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Literal,
+    overload,
+)
+
+from ..core import AsyncFn, Fn
 from ..pipeline import AsyncPipeline, Pipeline, apipe, pipe
 
+type _OpKind = Literal["map", "starmap", "filter", "take_while", "tap"]
+type _Op = tuple[_OpKind, Callable[..., Any], bool]
+"""
+A pending step of an async stream: its kind, the function to apply and whether
+the function is asynchronous (and its result must be awaited).
+"""
+
 
 class AsyncStream[I]:
     """
@@ -39,20 +56,112 @@ class AsyncStream[I]:
     ```
     """
 
-    _aiter: AsyncIterable[I]
+    __slots__ = ("_aiter", "_ops")
+
+    _aiter: AsyncIterable[Any]
+    _ops: tuple[_Op, ...]
 
     def __init__(self, input: AsyncIterable[I]):
-        """Initialize the `AsyncStream` with an input async iterable."""
-        self._aiter = input
+        """
+        Initialize the `AsyncStream` with an input async iterable.
+        If the input is itself an `AsyncStream`, its input and pending steps are
+        taken over instead of wrapping it.
+        """
+        if isinstance(input, AsyncStream):
+            self._aiter = input._aiter
+            self._ops = input._ops
+        else:
+            self._aiter = input
+            self._ops = ()
+
+    def __aiter__(self) -> AsyncIterator[I]:
+        """
+        Iterate over the async stream.
+
+        If there are no pending steps, the iterator of the underlying input is
+        returned as is, so that no extra async generator layer is added.
+        Otherwise all the pending steps are applied in a single async loop.
+        """
+        if not self._ops:
+            return aiter(self._aiter)
+        if any(is_async for _, _, is_async in self._ops):
+            return self._fused()
+        return self._fused_sync()
+
+    def _with_op(
+        self, kind: _OpKind, fn: Callable[..., Any], is_async: bool | None = None
+    ) -> AsyncStream[Any]:
+        """
+        Return a new stream over the same input with one more pending step.
+        Whether `fn` is asynchronous is checked once, here, rather than per item.
+        """
+        if is_async is None:
+            is_async = inspect.iscoroutinefunction(fn)
+        stream = AsyncStream(self._aiter)
+        stream._ops = (*self._ops, (kind, fn, is_async))
+        return stream
 
-    async def __aiter__(self) -> AsyncIterator[I]:
-        """Iterate over the async stream"""
-        async for item in self._aiter:
-            yield item
+    async def _fused(self) -> AsyncIterator[I]:
+        """
+        Apply all the pending steps to each item of the input in a single loop,
+        instead of chaining one async generator per step. The input is closed
+        when the loop ends, including when the stream is closed early.
+        """
+        ops = self._ops
+        iterator = aiter(self._aiter)
+        try:
+            async for item in iterator:
+                for kind, fn, is_async in ops:
+                    result = fn(*item) if kind == "starmap" else fn(item)
+                    if is_async:
+                        result = await result
+                    if kind == "map" or kind == "starmap":
+                        item = result
+                    elif kind == "filter":
+                        if not result:
+                            break
+                    elif kind == "take_while":
+                        if not result:
+                            return
+                else:
+                    yield item
+        finally:
+            await _aclose(iterator)
+
+    async def _fused_sync(self) -> AsyncIterator[I]:
+        """
+        Same as `_fused`, for when none of the pending steps is asynchronous, so
+        that no step result has to be checked for awaiting.
+        """
+        ops = [(kind, fn) for kind, fn, _ in self._ops]
+        iterator = aiter(self._aiter)
+        try:
+            async for item in iterator:
+                for kind, fn in ops:
+                    if kind == "map":
+                        item = fn(item)
+                    elif kind == "starmap":
+                        item = fn(*item)
+                    elif kind == "filter":
+                        if not fn(item):
+                            break
+                    elif kind == "take_while":
+                        if not fn(item):
+                            return
+                    else:
+                        fn(item)
+                else:
+                    yield item
+        finally:
+            await _aclose(iterator)
 
     def __repr__(self) -> str:
-        """Return a string representation of the async stream"""
-        return f"AsyncStream({self._aiter.__repr__()})"
+        """Return a string representation of the async stream and its pending steps"""
+        steps = "".join(
+            _repr_step(kind, None if fn is _is_not_none else fn)
+            for kind, fn, _ in self._ops
+        )
+        return f"AsyncStream({self._aiter.__repr__()}){steps}"
 
     async def to_pipe(self) -> Pipeline[Iterable[I], Iterable[I]]:
         """Convert the async stream to a pipeline."""
@@ -101,7 +210,9 @@ class AsyncStream[I]:
             >>> assert result == (2, 4)
         """
         collected = [i async for i in self]
-        return collected if not into else into(collected)
+        if into is None or into is list:
+            return collected
+        return into(collected)
 
     # endregion --collect
 
@@ -119,11 +230,35 @@ class AsyncStream[I]:
         ```
         """
 
-        async def amap():
-            async for i in self:
-                yield await as_async(fn)(i)
+        return self._with_op("map", fn)
 
-        return AsyncStream(amap())
+    def starmap[*Ts, O](
+        self: AsyncStream[tuple[*Ts]],
+        fn: Callable[[*Ts], O] | Callable[[*Ts], Coroutine[Any, Any, O]],
+    ) -> AsyncStream[O]:
+        """
+        Adds a mapping step to the stream that unpacks each item as the
+        arguments of the mapping function, returning a new stream of the
+        mapped values. The mapping function can be either synchronous or
+        asynchronous.
+
+        Args:
+            fn (Callable[[*Ts], O] | Callable[[*Ts], Coroutine[Any, Any, O]]): A
+            synchronous or asynchronous mapping function taking the unpacked items
+            as arguments
+
+        Returns:
+            AsyncStream[O]: a new stream of the mapped values
+
+        Raises:
+            TypeError: If an item cannot be unpacked as arguments.
+
+        Example:
+            >>> result = await astream(apairs).starmap(lambda x, y: x * y).collect()
+            >>> assert result == [2, 12]
+        """
+
+        return self._with_op("starmap", fn)
 
     def filter(self, fn: Fn[I, bool] | AsyncFn[I, bool] | None) -> AsyncStream[I]:
         """
@@ -145,20 +280,15 @@ class AsyncStream[I]:
             >>> assert result == [1, 3]
         """
 
-        async def afilter():
-            async for i in self:
-                if fn is None:
-                    if i is not None:
-                        yield i
-                elif await as_async(fn)(i):
-                    yield i
-
-        return AsyncStream(afilter())
+        if fn is None:
+            return self._with_op("filter", _is_not_none, False)
+        return self._with_op("filter", fn)
 
     def take(self, n: int) -> AsyncStream[I]:
         """
         Adds a take step to the stream, returning a new stream of at most the
-        first `n` values.
+        first `n` values. No value past the `n`-th is pulled from the input, which
+        is closed as soon as `n` values have been taken.
 
         Args:
             n (int): The maximum number of items to take from the stream.
@@ -177,19 +307,24 @@ class AsyncStream[I]:
         """
 
         async def atake() -> AsyncIterator[I]:
+            if n <= 0:
+                return
+            iterator = aiter(self)
             count = 0
-            async for item in self:
-                if count >= n:
-                    break
+            async for item in iterator:
                 yield item
                 count += 1
+                if count >= n:
+                    await _aclose(iterator)
+                    break
 
         return AsyncStream(atake())
 
     def take_while(self, fn: Fn[I, bool] | AsyncFn[I, bool]) -> AsyncStream[I]:
         """
         Adds a take_while step to the stream, returning a new stream of the
-        values taken while the predicate is true.
+        values taken while the predicate is true. The input is closed as soon as
+        the predicate is false.
 
         Args:
             fn (Fn[I, bool] | AsyncFn[I, bool]): A synchronous or asynchronous
@@ -200,13 +335,30 @@ class AsyncStream[I]:
             predicate is true.
         """
 
-        async def atake_while() -> AsyncIterator[I]:
-            async for item in self:
-                if not await as_async(fn)(item):
-                    break
-                yield item
+        return self._with_op("take_while", fn)
+
+    def tap(self, fn: Fn[I, Any] | AsyncFn[I, Any]) -> AsyncStream[I]:
+        """
+        Adds a step to the stream that calls `fn` on each value for its side
+        effects (eg. logging), returning a new stream of the same values.
+        The function can be either synchronous or asynchronous.
+
+        Args:
+            fn (Fn[I, Any] | AsyncFn[I, Any]): A synchronous or asynchronous
+            function, whose result is ignored
+
+        Returns:
+            AsyncStream[I]: a new stream of the same values
 
-        return AsyncStream(atake_while())
+        Example:
+            >>> result = await astream(ayield_range(1, 4)).tap(print).collect()
+            1
+            2
+            3
+            >>> assert result == [1, 2, 3]
+        """
+
+        return self._with_op("tap", fn)
 
     def default(self, default: I) -> AsyncStream[I]:
         """
@@ -238,6 +390,28 @@ class AsyncStream[I]:
     # endregion --ops
 
 
+def _is_not_none(value: Any) -> bool:
+    return value is not None
+
+
+def _repr_step(name: str, *args: Any) -> str:
+    """Represent a pending step as the method call that added it."""
+    shown = (getattr(arg, "__name__", None) or repr(arg) for arg in args)
+    return f".{name}({', '.join(shown)})"
+
+
+async def _aclose(iterator: AsyncIterator[Any]) -> None:
+    """Close an async iterator early, if it supports it (eg. async generators)."""
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 def astream[I](input: AsyncIterable[I]) -> AsyncStream[I]:
-    """Alias for the `AsyncStream` constructor."""
+    """
+    Alias for the `AsyncStream` constructor.
+    An input that is already an `AsyncStream` is returned as is.
+    """
+    if isinstance(input, AsyncStream):
+        return input
     return AsyncStream(input)
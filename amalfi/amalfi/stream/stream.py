@@ -1,11 +1,57 @@
 from __future__ import annotations
 
-from itertools import islice, takewhile
-from typing import Iterable, Iterator, overload
-
-from ..core import Fn, as_aiter
+from collections import deque
+from functools import reduce
+from itertools import batched, chain, islice, starmap, takewhile
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    Sized,
+    cast,
+    overload,
+)
+
+from ..core import Fn, VFn, as_aiter
 from ..pipeline import AsyncPipeline, Pipeline, apipe, pipe
-from .astream import AsyncStream
+from .astream import AsyncStream, _repr_step
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+type _Op = tuple[Callable[[Any, Iterator[Any]], Iterator[Any]], Any]
+"""
+A pending step of a stream: an iterator constructor taking `(fn, iterator)`,
+such as `map` or `filter`, along with the function (or argument) to apply.
+"""
+
+type _StreamOfIterables[T] = (
+    Stream[list[T]]
+    | Stream[tuple[T, ...]]
+    | Stream[set[T]]
+    | Stream[frozenset[T]]
+    | Stream[Iterator[T]]
+    | Stream[Iterable[T]]
+)
+"""
+A stream of iterables of `T`. `Stream` is invariant, so `Stream[list[T]]` is not
+a `Stream[Iterable[T]]`: the common iterable types are listed explicitly.
+"""
+
+_END = object()
+"""Marker put in a prefetch buffer once the upstream stream is exhausted."""
+
+_SLICEABLE: tuple[type, ...] = (list, tuple, range, str, bytes)
+"""Inputs whose first values can be taken by slicing instead of iterating."""
+
+_BUILTIN_COLLECTORS: tuple[type, ...] = (tuple, set, frozenset, deque)
+"""Collectors that are fed the underlying iterator of the stream directly."""
 
 
 class Stream[I]:
@@ -49,19 +95,48 @@ class Stream[I]:
     ```
     """
 
-    _iter: Iterable[I]
+    __slots__ = ("_iter", "_ops")
+
+    _iter: Iterable[Any]
+    _ops: tuple[_Op, ...]
 
     def __init__(self, input: Iterable[I]):
         """Initialize the `Stream` with an input iterable."""
         self._iter = input
+        self._ops = ()
 
     def __iter__(self) -> Iterator[I]:
         """Iterate over the stream"""
-        yield from self._iter
+        return self._fused()
+
+    def _with_op(
+        self, make: Callable[[Any, Iterator[Any]], Iterator[Any]], fn: Any
+    ) -> Stream[Any]:
+        """
+        Return a new stream over the same input with one more pending step.
+        Steps are not applied until the stream is iterated.
+        """
+        stream = Stream(self._iter)
+        stream._ops = (*self._ops, (make, fn))
+        return stream
+
+    def _fused(self) -> Iterator[I]:
+        """
+        Build the iterator of the stream by applying the pending steps to the
+        input at once, as a single chain of builtin iterators.
+        """
+        it: Iterator[Any] = iter(self._iter)
+        for make, fn in self._ops:
+            it = make(fn, it)
+        return it
 
     def __repr__(self) -> str:
-        """Return a string representation of the stream"""
-        return f"Stream({self._iter.__repr__()})"
+        """Return a string representation of the stream and its pending steps"""
+        steps = "".join(
+            _repr_step(_STEP_NAMES[make], *(arg if isinstance(arg, tuple) else (arg,)))
+            for make, arg in self._ops
+        )
+        return f"Stream({self._iter.__repr__()}){steps}"
 
     def to_async(self) -> AsyncStream[I]:
         """Convert the stream to an async stream."""
@@ -69,11 +144,11 @@ class Stream[I]:
 
     def to_pipe(self) -> Pipeline[Iterable[I], Iterable[I]]:
         """Convert the stream to a pipeline."""
-        return pipe(iter(self))
+        return pipe(self._fused())
 
     def to_apipe(self) -> AsyncPipeline[Iterable[I], Iterable[I]]:
         """Convert the stream to an async pipeline."""
-        return apipe(iter(self))
+        return apipe(self._fused())
 
     # region: --collect
     @overload
@@ -106,8 +181,11 @@ class Stream[I]:
             >>> result = stream([1, 2, 3]).map(lambda x: x + 1).collect(into=tuple)
             >>> assert result == (2, 3, 4)
         """
-        if not into:
-            return list(self)
+        src = self._fused() if self._ops else self._iter
+        if into is None or into is list:
+            return list(src)
+        if into in _BUILTIN_COLLECTORS:
+            return into(src)
         return into(self)
 
     # endregion --collect
@@ -129,7 +207,73 @@ class Stream[I]:
             >>> assert result == [2, 3, 4]
         """
 
-        return Stream(map(fn, self))
+        return self._with_op(map, fn)
+
+    def starmap[*Ts, O](self: Stream[tuple[*Ts]], fn: Callable[[*Ts], O]) -> Stream[O]:
+        """
+        Adds a mapping step to the stream that unpacks each item as the
+        arguments of the mapping function, returning a new stream of the
+        mapped values. Analogous to `itertools.starmap`.
+
+        Args:
+            fn (Callable[[*Ts], O]): A synchronous mapping function taking the
+            unpacked items as arguments
+
+        Returns:
+            Stream[O]: a new stream of the mapped values
+
+        Raises:
+            TypeError: If an item cannot be unpacked as arguments.
+
+        Example:
+            >>> result = stream([(1, 2), (3, 4)]).starmap(lambda x, y: x * y).collect()
+            >>> assert result == [2, 12]
+        """
+        return self._with_op(starmap, fn)
+
+    def map_batched[O](self, fn: Fn[tuple[I, ...], O], size: int) -> Stream[O]:
+        """
+        Adds a mapping step to the stream that applies the mapping function to
+        batches of `size` items at a time, returning a new stream of the mapped
+        batches. The last batch may be shorter than `size`.
+
+        Useful for functions that are vectorized or that have a fixed cost per call,
+        so that the cost is paid once per batch instead of once per item.
+
+        Args:
+            fn (Fn[tuple[I, ...], O]): A synchronous mapping function taking a
+            tuple of items
+            size (int): The number of items per batch
+
+        Returns:
+            Stream[O]: a new stream of the mapped batches
+
+        Raises:
+            ValueError: If `size` is less than one.
+
+        Example:
+            >>> result = stream([1, 2, 3, 4, 5]).map_batched(sum, 2).collect()
+            >>> assert result == [3, 7, 5]
+            >>> result = stream([1, 2, 3]).map_batched(list, 2).unbatch().collect()
+            >>> assert result == [1, 2, 3]
+        """
+        if size < 1:
+            raise ValueError(f"Cannot batch fewer than one value at a time: {size}")
+        return self._with_op(_map_batched, (fn, size))
+
+    def unbatch[T](self: _StreamOfIterables[T]) -> Stream[T]:
+        """
+        Flattens a stream of iterables into a stream of their items.
+        Reverses `map_batched` when the mapped batches are iterables.
+
+        Returns:
+            Stream[T]: a new stream of the items of each iterable
+
+        Example:
+            >>> result = stream([[1, 2], [3]]).unbatch().collect()
+            >>> assert result == [1, 2, 3]
+        """
+        return self._with_op(_unbatch, ())
 
     def filter(self, fn: Fn[I, bool] | None) -> Stream[I]:
         """
@@ -149,7 +293,7 @@ class Stream[I]:
             >>> result = stream([1, None, 3]).filter(None).collect()
             >>> assert result == [1, 3]
         """
-        return Stream(filter(fn, self))
+        return self._with_op(filter, fn)
 
     def take(self, n: int) -> Stream[I]:
         """
@@ -160,8 +304,16 @@ class Stream[I]:
 
         Returns:
             Stream[I]: a new stream of the first `n` values
+
+        Raises:
+            ValueError: If `n` is negative.
         """
-        return Stream(islice(self, n))
+        if n < 0:
+            raise ValueError(f"Cannot take a negative number of values: {n}")
+        src = self._iter
+        if not self._ops and isinstance(src, _SLICEABLE):
+            return Stream(cast(Sequence[I], src)[:n])
+        return self._with_op(_take, n)
 
     def take_while(self, fn: Fn[I, bool]) -> Stream[I]:
         """
@@ -173,7 +325,50 @@ class Stream[I]:
         Returns:
             Stream[I]: a new stream of the values taken while the predicate is true
         """
-        return Stream(takewhile(fn, self))
+        return self._with_op(takewhile, fn)
+
+    def tap(self, fn: Fn[I, Any]) -> Stream[I]:
+        """
+        Adds a step to the stream that calls `fn` on each value for its side
+        effects (eg. logging), returning a new stream of the same values.
+
+        Args:
+            fn (Fn[I, Any]): A synchronous function, whose result is ignored
+
+        Returns:
+            Stream[I]: a new stream of the same values
+
+        Example:
+            >>> result = stream([1, 2, 3]).tap(print).collect()
+            1
+            2
+            3
+            >>> assert result == [1, 2, 3]
+        """
+        return self._with_op(_tap, fn)
+
+    def reduce[O](self, fn: VFn[[O, I], O], initial: O) -> Stream[O]:
+        """
+        Reduces the stream to a single value using a reducer function, returning
+        a new stream containing only the reduced value.
+
+        Unlike the other steps, the reduction is evaluated eagerly: the stream is
+        consumed when `reduce` is called, as a reduction always needs all of its
+        values anyway.
+
+        Args:
+            fn (VFn[[O, I], O]): Reducer function taking the accumulated value and
+            the next value of the stream
+            initial (O): The initial value for the reduction
+
+        Returns:
+            Stream[O]: a new stream containing the reduced value
+
+        Example:
+            >>> result = stream([1, 2, 3]).reduce(lambda acc, x: acc + x, 0).collect()
+            >>> assert result == [6]
+        """
+        return Stream((reduce(fn, self, initial),))
 
     def default(self, default: I) -> Stream[I]:
         """
@@ -192,8 +387,12 @@ class Stream[I]:
             >>> assert result == [0]
         """
 
+        src = self._iter
+        if not self._ops and isinstance(src, Sized):
+            return Stream(src) if len(src) else Stream((default,))
+
         def default_gen() -> Iterator[I]:
-            stream_iter = iter(self)
+            stream_iter = self._fused()
             try:
                 yield next(stream_iter)
                 yield from stream_iter
@@ -204,6 +403,154 @@ class Stream[I]:
 
     # endregion --ops
 
+    # region: --concurrency
+    def prefetch(self, n: int = 64) -> Stream[I]:
+        """
+        Returns a stream that pulls up to `n` values ahead of the consumer in a
+        background thread, so that a slow (eg. I/O bound) upstream overlaps with
+        the work done downstream.
+
+        The background thread is started when the stream is first iterated.
+        Values are yielded in order, and any exception raised upstream is raised
+        to the consumer once the values pulled before it have been yielded.
+        If the consumer stops early, at most `n + 1` values past the last one it
+        consumed are pulled upstream: a full buffer plus the value waiting for room.
+
+        Args:
+            n (int): The maximum number of values to buffer. If less than one,
+            the buffer is unbounded.
+
+        Returns:
+            Stream[I]: a new stream of the same values, prefetched in a thread
+
+        Example:
+            >>> result = stream(read_lines(path)).prefetch(128).map(parse).collect()
+        """
+
+        def prefetch_gen() -> Iterator[I]:
+            buffer: Queue[Any] = Queue(maxsize=n)
+            stopped = Event()
+            errors: list[BaseException] = []
+
+            def produce() -> None:
+                try:
+                    for item in self:
+                        buffer.put(item)
+                        if stopped.is_set():
+                            return
+                except BaseException as e:
+                    errors.append(e)
+                if not stopped.is_set():
+                    buffer.put(_END)
+
+            Thread(target=produce, name="amalfi-prefetch", daemon=True).start()
+            try:
+                while (item := buffer.get()) is not _END:
+                    yield item
+            finally:
+                stopped.set()
+                while True:  # unblock a producer waiting on a full buffer
+                    try:
+                        buffer.get_nowait()
+                    except Empty:
+                        break
+            if errors:
+                raise errors[0]
+
+        return Stream(prefetch_gen())
+
+    def pmap[O](
+        self,
+        fn: Fn[I, O],
+        workers: int | None = None,
+        chunksize: int = 64,
+        mode: Literal["process", "thread"] = "process",
+    ) -> Stream[O]:
+        """
+        Adds a parallel mapping step to the stream, returning a new stream of the
+        mapped values in the same order as the input.
+
+        The mapping function runs in a pool of processes (for CPU bound functions)
+        or threads (for I/O bound functions or functions releasing the GIL).
+        The pool is created when the stream is first iterated and shut down once
+        the stream is exhausted or closed.
+
+        Note that, as with `Executor.map`, the whole upstream is consumed and
+        submitted to the pool as soon as iteration starts, so it must be finite.
+        In process mode, `fn` and the values must be picklable.
+
+        Args:
+            fn (Fn[I, O]): A synchronous mapping function
+            workers (int | None): The maximum number of workers of the pool,
+            which defaults to the `concurrent.futures` default.
+            chunksize (int): The number of values sent to a worker process at once.
+            Ignored in thread mode.
+            mode (Literal["process", "thread"]): The kind of pool to use.
+
+        Returns:
+            Stream[O]: a new stream of the mapped values
+
+        Example:
+            >>> result = stream([1, 2, 3]).pmap(heavy_square, workers=2).collect()
+            >>> assert result == [1, 4, 9]
+        """
+
+        def pmap_gen() -> Iterator[O]:
+            # imported here, as process pools load `multiprocessing`
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+            executor: Executor = (
+                ProcessPoolExecutor(workers)
+                if mode == "process"
+                else ThreadPoolExecutor(workers)
+            )
+            try:
+                yield from executor.map(fn, self, chunksize=chunksize)
+            finally:
+                executor.shutdown(cancel_futures=True)
+
+        return Stream(pmap_gen())
+
+    # endregion --concurrency
+
+
+def _tap[T](fn: Fn[T, Any], iterable: Iterable[T]) -> Iterator[T]:
+    """Call `fn` on each item of the iterable and yield the item unchanged."""
+    for item in iterable:
+        fn(item)
+        yield item
+
+
+def _take[T](n: int, iterable: Iterable[T]) -> Iterator[T]:
+    """Take the first `n` items of the iterable, with the arguments of a step."""
+    return islice(iterable, n)
+
+
+def _map_batched[T, O](
+    args: tuple[Fn[tuple[T, ...], O], int], iterable: Iterable[T]
+) -> Iterator[O]:
+    """Map `fn` over tuples of `size` items of the iterable, as a step."""
+    fn, size = args
+    return map(fn, batched(iterable, size))
+
+
+def _unbatch[T](_: tuple[()], iterable: Iterable[Iterable[T]]) -> Iterator[T]:
+    """Flatten an iterable of iterables, with the arguments of a step."""
+    return chain.from_iterable(iterable)
+
+
+_STEP_NAMES: dict[Callable[..., Iterator[Any]], str] = {
+    map: "map",
+    starmap: "starmap",
+    _map_batched: "map_batched",
+    _unbatch: "unbatch",
+    filter: "filter",
+    _take: "take",
+    takewhile: "take_while",
+    _tap: "tap",
+}
+"""The name of the method adding each kind of pending step, for `repr`."""
+
 
 def stream[I](input: Iterable[I]) -> Stream[I]:
     """Alias for the `Stream` constructor.
@@ -217,14 +564,13 @@ def stream[I](input: Iterable[I]) -> Stream[I]:
 
 # TODO:
 # - operators: see https://rxjs.dev/guide/operators#transformation-operators
-# -- reduce / areduce
+# -- areduce
 # -- catch_error
 # -- count
 # -- fork / afork
 # -- group_by
 # -- partition
 # -- scan
-# -- tap
 # -- zip
 # -- chain
 # -- flat_map
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from amalfi.ops import amap, filter_, map_
@@ -33,6 +35,28 @@ class TestAsyncMap:
 
         assert result == 18
 
+    @pytest.mark.anyio
+    async def test_async_map_with_limit(self):
+        running = 0
+        max_running = 0
+
+        async def track(x: int) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return x
+
+        result = await amap(track, limit=2)(range(5))
+        assert result == [0, 1, 2, 3, 4]
+        assert max_running == 2
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_async_map_with_invalid_limit(self, limit: int):
+        with pytest.raises(ValueError):
+            amap(wait_and_emphasize, limit=limit)
+
 
 class TestTryAsyncMap:
     @pytest.mark.anyio
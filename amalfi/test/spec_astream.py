@@ -1,5 +1,6 @@
 import asyncio
-from typing import AsyncIterable
+from functools import partial
+from typing import AsyncIterable, AsyncIterator
 
 import pytest
 
@@ -8,12 +9,26 @@ from amalfi.ops.map import amap
 from amalfi.pipeline import AsyncPipeline, Pipeline, pipe
 from amalfi.stream import AsyncStream, astream
 
-from .stub import add_one, ayield_range, wait_and_add_one, wait_and_double
+from .stub import (
+    add_one,
+    apairs,
+    ayield_items,
+    ayield_range,
+    multiply,
+    wait_and_add_one,
+    wait_and_double,
+    wait_and_multiply,
+)
+
+
+@pytest.fixture(scope="module")
+def values() -> tuple[int, ...]:
+    return tuple(range(1, 4))
 
 
 @pytest.fixture
-def ainput():
-    return ayield_range(1, 4)
+def ainput(values: tuple[int, ...]):
+    return ayield_items(values)
 
 
 class TestAsyncStream:
@@ -26,6 +41,19 @@ class TestAsyncStream:
     async def test_alias(self, ainput: AsyncIterable[int]):
         assert [i async for i in astream(ainput)] == [1, 2, 3]
 
+    @pytest.mark.anyio
+    async def test_from_stream(self, ainput: AsyncIterable[int]):
+        s = astream(ainput).map(add_one)
+        assert astream(s) is s
+        assert await AsyncStream(s).map(add_one).collect() == [3, 4, 5]
+
+    def test_repr(self, values: tuple[int, ...]):
+        s = astream(ayield_items(values))
+        assert repr(s).startswith("AsyncStream(<async_generator")
+        assert repr(s.map(str).filter(None).take_while(str.isdigit)).endswith(
+            ").map(str).filter(None).take_while(isdigit)"
+        )
+
     @pytest.mark.anyio
     async def test_to_pipe(self, ainput: AsyncIterable[int]):
         p = (await astream(ainput).to_pipe()) | map_(add_one) | sum
@@ -48,6 +76,10 @@ class TestAsyncStream:
             as_tuple = await astream(ainput).collect(into=tuple)
             assert as_tuple == (1, 2, 3)
 
+        @pytest.mark.anyio
+        async def test_collect_into_list(self, ainput: AsyncIterable[int]):
+            assert await astream(ainput).collect(into=list) == [1, 2, 3]
+
         @pytest.mark.anyio
         async def test_collect_into_pipeline(self, ainput: AsyncIterable[int]):
             apipeline = (
@@ -60,6 +92,39 @@ class TestAsyncStream:
             assert isinstance(apipeline, AsyncPipeline)
             assert await apipeline.run() == 10
 
+    class TestFusedSteps:
+        @pytest.mark.anyio
+        async def test_mixed_steps(self, ainput: AsyncIterable[int]):
+            tapped: list[int] = []
+            result = await (
+                astream(ainput)
+                .map(wait_and_add_one)
+                .filter(lambda x: x % 2 == 0)
+                .tap(tapped.append)
+                .map(add_one)
+                .take_while(lambda x: x < 5)
+                .collect()
+            )
+            assert result == [3]
+            assert tapped == [2, 4]
+
+        @pytest.mark.anyio
+        async def test_sync_steps(self, ainput: AsyncIterable[int]):
+            result = await (
+                astream(ainput)
+                .map(add_one)
+                .filter(lambda x: x > 2)
+                .map(lambda x: (x, x))
+                .starmap(multiply)
+                .collect()
+            )
+            assert result == [9, 16]
+
+        @pytest.mark.anyio
+        async def test_async_partial(self, ainput: AsyncIterable[int]):
+            result = await astream(ainput).map(partial(wait_and_multiply, 2)).collect()
+            assert result == [2, 4, 6]
+
     class TestMap:
         @pytest.mark.anyio
         async def test_map(self, ainput: AsyncIterable[int]):
@@ -67,6 +132,19 @@ class TestAsyncStream:
             assert isinstance(s, AsyncStream)
             assert await s.collect() == [6, 8, 10]
 
+    class TestStarmap:
+        @pytest.mark.anyio
+        async def test_starmap(self):
+            s = astream(apairs([(1, 2), (3, 4), (5, 6)])).starmap(multiply)
+            assert isinstance(s, AsyncStream)
+            assert await s.collect() == [2, 12, 30]
+
+        @pytest.mark.anyio
+        async def test_astarmap(self):
+            s = astream(apairs([(1, 2), (3, 4), (5, 6)])).starmap(wait_and_multiply)
+            assert isinstance(s, AsyncStream)
+            assert await s.collect() == [2, 12, 30]
+
     class TestFilter:
         @pytest.mark.anyio
         async def test_filter(self, ainput: AsyncIterable[int]):
@@ -77,7 +155,7 @@ class TestAsyncStream:
         @pytest.mark.anyio
         async def test_afilter(self, ainput: AsyncIterable[int]):
             async def is_even(x: int) -> bool:
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
                 return x % 2 == 0
 
             s = astream(ainput).filter(is_even)
@@ -87,7 +165,7 @@ class TestAsyncStream:
         @pytest.mark.anyio
         async def test_filter_none(self):
             async def ainput_with_none():
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
                 yield 1
                 yield None
                 yield 3
@@ -103,6 +181,64 @@ class TestAsyncStream:
             assert isinstance(s, AsyncStream)
             assert await s.collect() == [1, 2]
 
+        @pytest.mark.anyio
+        async def test_take_stops_pulling(self):
+            pulled: list[int] = []
+            closed = False
+
+            async def source() -> AsyncIterator[int]:
+                nonlocal closed
+                try:
+                    for i in range(10):
+                        pulled.append(i)
+                        yield i
+                finally:
+                    closed = True
+
+            assert await astream(source()).take(2).collect() == [0, 1]
+            assert pulled == [0, 1]
+            assert closed
+
+        @pytest.mark.anyio
+        async def test_take_after_steps_closes_input(self):
+            pulled: list[int] = []
+            closed = False
+
+            async def source() -> AsyncIterator[int]:
+                nonlocal closed
+                try:
+                    for i in range(10):
+                        pulled.append(i)
+                        yield i
+                finally:
+                    closed = True
+
+            s = astream(source()).map(add_one).filter(None).take(2)
+            assert await s.collect() == [1, 2]
+            assert pulled == [0, 1]
+            assert closed
+
+            closed = False
+            s = astream(source()).map(wait_and_add_one).take(2)
+            assert await s.collect() == [1, 2]
+            assert closed
+
+        @pytest.mark.anyio
+        async def test_take_while_closes_input(self):
+            closed = False
+
+            async def source() -> AsyncIterator[int]:
+                nonlocal closed
+                try:
+                    for i in range(10):
+                        yield i
+                finally:
+                    closed = True
+
+            result = await astream(source()).take_while(lambda x: x < 2).collect()
+            assert result == [0, 1]
+            assert closed
+
         @pytest.mark.anyio
         async def test_take_while(self, ainput: AsyncIterable[int]):
             s = astream(ainput).take_while(lambda x: x < 3)
@@ -112,13 +248,35 @@ class TestAsyncStream:
         @pytest.mark.anyio
         async def test_take_while_with_async_fn(self, ainput: AsyncIterable[int]):
             async def is_less_than_three(x: int) -> bool:
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
                 return x < 3
 
             s = astream(ainput).take_while(is_less_than_three)
             assert isinstance(s, AsyncStream)
             assert await s.collect() == [1, 2]
 
+    class TestTap:
+        @pytest.mark.anyio
+        async def test_tap(self, ainput: AsyncIterable[int]):
+            tapped: list[int] = []
+            s = astream(ainput).tap(tapped.append).map(add_one)
+            assert isinstance(s, AsyncStream)
+            assert await s.collect() == [2, 3, 4]
+            assert tapped == [1, 2, 3]
+
+        @pytest.mark.anyio
+        async def test_atap(self, ainput: AsyncIterable[int]):
+            tapped: list[int] = []
+
+            async def wait_and_record(x: int) -> None:
+                await asyncio.sleep(0)
+                tapped.append(x)
+
+            s = astream(ainput).tap(wait_and_record)
+            assert isinstance(s, AsyncStream)
+            assert await s.collect() == [1, 2, 3]
+            assert tapped == [1, 2, 3]
+
     class TestDefault:
         @pytest.mark.anyio
         async def test_default(self, ainput: AsyncIterable[int]):
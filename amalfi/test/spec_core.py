@@ -55,6 +55,12 @@ class TestAsAsync:
         assert inspect.iscoroutine(result)
         assert await result == 2
 
+    def test_as_async_already_async(self):
+        async def add_one(x: int) -> int:
+            return x + 1
+
+        assert as_async(add_one) is add_one
+
 
 class TestAiter:
     @pytest.mark.anyio
@@ -16,6 +16,12 @@ class TestPipeline:
     def test_pipe(self):
         result = Pipeline(1).run()
         assert result == 1
+        assert Pipeline(1).compile().run() == 1
+
+    def test_identity_step_dropped(self):
+        pipeline = pipe(1) | add_one
+        assert pipeline.fn is add_one
+        assert pipeline() == 2
 
     def test_composed_pipe(self):
         result = (
@@ -33,7 +39,7 @@ class TestPipeline:
         assert result == "2"
 
     def test_with_input(self):
-        pipeline = pipe(1) | add_one | double
+        pipeline = (pipe(1) | add_one | double).compile()
         pipeline = pipeline.with_input(2)
         assert pipeline.input == 2
         assert pipeline() == 6
@@ -45,6 +51,28 @@ class TestPipeline:
         pipeline2 = pipe(0) | double
         pipeline = pipeline1 > pipeline2
         assert pipeline() == 4
+        assert pipeline.compile().run() == 4
+
+    def test_set_fn(self):
+        pipeline = pipe(1) | add_one | double
+        assert pipeline() == 4
+        pipeline.fn = add_one
+        assert pipeline.fn is add_one
+        assert (pipeline | double)() == 4
+
+    def test_compiled_once(self):
+        pipeline = pipe(1) | add_one | double
+        assert pipeline.fn is pipeline.fn
+        assert pipeline() == 4
+        assert pipeline.with_input(2)() == 6
+
+    def test_compile(self):
+        pipeline = pipe(1) | add_one | double | str
+        assert pipeline.compile() is pipeline
+        assert pipeline.fn is pipeline.fn
+        assert pipeline.run() == "4"
+        assert pipeline.with_input(2).run() == "6"
+        assert (pipeline | len).compile().run() == 1
 
     @pytest.mark.anyio
     async def test_to_async(self):
@@ -103,6 +131,30 @@ class TestAsyncPipeline:
         pipeline = pipeline1 > pipeline2
         assert await pipeline() == 5
 
+    @pytest.mark.anyio
+    async def test_sync_steps(self):
+        pipeline = apipe(1) | add_one | double | str
+        assert await pipeline() == "4"
+
+    @pytest.mark.anyio
+    async def test_set_fn(self):
+        pipeline = apipe(1) | wait_and_add_one | double
+        assert await pipeline() == 4
+        pipeline.fn = add_one
+        assert await pipeline() == 2
+        pipeline.fn = wait_and_add_one
+        assert await (pipeline | double)() == 4
+
+    @pytest.mark.anyio
+    async def test_compile(self):
+        pipeline = apipe(1) | add_one | wait_and_add_one | double
+        assert pipeline.compile() is pipeline
+        assert await pipeline.run() == 6
+        assert await pipeline.with_input(2).run() == 8
+        assert await (pipeline | str).compile().run() == "8"
+        assert await apipe(1).compile().run() == 1
+        assert await apipe(1).run() == 1
+
     @pytest.mark.anyio
     async def test_with_input(self):
         pipeline = apipe("Alice") | greet | wait_and_emphasize
@@ -1,4 +1,6 @@
+import threading
 from collections import deque
+from operator import add
 from typing import Iterable
 
 import pytest
@@ -8,12 +10,36 @@ from amalfi.ops.map import amap
 from amalfi.pipeline import AsyncPipeline, Pipeline, pipe
 from amalfi.stream import AsyncStream, Stream, stream
 
-from .stub import add_one, double, wait_and_add_one, yield_range
+from .stub import (
+    add_one,
+    double,
+    is_even,
+    multiply,
+    wait_and_add_one,
+    yield_range,
+)
 
 
-@pytest.fixture
-def input():
-    return yield_range(1, 4)
+def _double_all(values: Iterable[int]) -> list[int]:
+    return [2 * i for i in values]
+
+
+def _is_less_than_three(x: int) -> bool:
+    return x < 3
+
+
+def _is_less_than_eight(x: int) -> bool:
+    return x < 8
+
+
+@pytest.fixture(scope="module")
+def input() -> tuple[int, ...]:
+    return tuple(range(1, 4))
+
+
+@pytest.fixture(scope="module")
+def dup_input() -> tuple[int, ...]:
+    return (1, 1, 2, 3)  # includes duplicates
 
 
 class TestStream:
@@ -21,10 +47,40 @@ class TestStream:
         stream = Stream(input)
         assert list(stream) == [1, 2, 3]
 
+    def test_init_iterator(self):
+        stream = Stream(yield_range(1, 4))
+        assert list(stream) == [1, 2, 3]
+
     def test_alias(self, input: Iterable[int]):
         s = stream(input)
         assert list(s) == [1, 2, 3]
 
+    def test_ops_return_stream(self, input: Iterable[int]):
+        s = stream(input)
+        pairs = stream([(1, 2)])
+        for result in (
+            s.map(add_one),
+            pairs.starmap(multiply),
+            s.map_batched(sum, 2),
+            s.map_batched(list, 2).unbatch(),
+            s.filter(is_even),
+            s.take(2),
+            s.take_while(_is_less_than_three),
+            s.tap(add_one),
+            s.reduce(add, 0),
+            s.default(0),
+            s.prefetch(2),
+            s.pmap(double, mode="thread"),
+        ):
+            assert isinstance(result, Stream)
+
+    def test_repr(self):
+        s = stream(range(10))
+        assert repr(s) == "Stream(range(0, 10))"
+        assert repr(s.map(double).filter(None).map_batched(sum, 2).take(3)) == (
+            "Stream(range(0, 10)).map(double).filter(None).map_batched(sum, 2).take(3)"
+        )
+
     @pytest.mark.anyio
     async def test_to_async(self, input: Iterable[int]):
         async_stream = stream(input).to_async()
@@ -72,25 +128,30 @@ class TestStream:
                 (deque, deque([1, 1, 2, 3])),
             ],
         )
-        def test_collect_into(self, into: type, expected: type):
-            input = [1, 1, 2, 3]  # includes duplicates
-            assert stream(input).collect(into=into) == expected
+        def test_collect_into(
+            self, dup_input: tuple[int, ...], into: type, expected: type
+        ):
+            assert stream(dup_input).collect(into=into) == expected
+
+        def test_collect_into_dict(self):
+            pairs = {"a": 1, "b": 2}.items()
+            assert stream(pairs).collect(into=dict) == {"a": 1, "b": 2}
+            assert stream(pairs).filter(None).collect(into=dict) == {"a": 1, "b": 2}
+            with pytest.raises(ValueError):
+                stream({"a": 1}).collect(into=dict)  # type: ignore
 
         def test_collect_into_lambda(self, input: Iterable[int]):
-            result = stream(input).collect(into=lambda x: [2 * i for i in x])
+            result = stream(input).collect(into=_double_all)
             assert result == [2, 4, 6]
 
         def test_collect_into_pipeline(self, input: Iterable[int]):
-            pipeline = (
-                stream(input).collect(into=pipe).step(map_(lambda x: x + 1)).step(sum)
-            )
+            pipeline = stream(input).collect(into=pipe).step(map_(add_one)).step(sum)
             assert isinstance(pipeline, Pipeline)
             assert pipeline.run() == 9
 
     class TestMap:
         def test_map(self, input: Iterable[int]):
             s = stream(input).map(add_one)
-            assert isinstance(s, Stream)
             assert s.collect() == [2, 3, 4]
 
         def test_map_op(self, input: Iterable[int]):
@@ -98,10 +159,42 @@ class TestStream:
             result = list(doubled(stream(input)))
             assert result == [2, 4, 6]
 
+    class TestStarmap:
+        def test_starmap(self):
+            s = stream([(1, 2), (3, 4), (5, 6)]).starmap(multiply)
+            assert s.collect() == [2, 12, 30]
+
+        def test_starmap_non_tuple(self):
+            with pytest.raises(TypeError):
+                stream([1, 2]).starmap(multiply).collect()  # type: ignore
+
+    class TestBatched:
+        def test_map_batched(self):
+            s = stream(yield_range(1, 6)).map_batched(sum, 2)
+            assert s.collect() == [3, 7, 5]
+
+        def test_map_batched_invalid_size(self):
+            with pytest.raises(ValueError):
+                stream([1, 2]).map_batched(sum, 0)
+            with pytest.raises(ValueError):
+                stream([1, 2]).map(add_one).map_batched(sum, -1)
+
+        def test_unbatch(self):
+            s = stream(yield_range(1, 6)).map_batched(list, 2).unbatch()
+            assert s.collect() == [1, 2, 3, 4, 5]
+
+        def test_reiterable(self, input: Iterable[int]):
+            s = stream(input).map_batched(sum, 2)
+            assert s.collect() == [3, 3]
+            assert s.collect() == [3, 3]
+
+            s = stream(input).map_batched(list, 2).unbatch()
+            assert s.collect() == [1, 2, 3]
+            assert s.collect() == [1, 2, 3]
+
     class TestFilter:
         def test_filter(self, input: Iterable[int]):
-            s = stream(input).map(lambda x: x + 1).filter(lambda x: x % 2 == 0)
-            assert isinstance(s, Stream)
+            s = stream(input).map(add_one).filter(is_even)
             assert s.collect() == [2, 4]
 
         def test_filter_none(self):
@@ -111,31 +204,124 @@ class TestStream:
                 yield 3
 
             s = stream(input_with_none()).filter(None)
-            assert isinstance(s, Stream)
             assert s.collect() == [1, 3]
 
+    class TestFusedSteps:
+        def test_chained_steps(self, input: Iterable[int]):
+            s = (
+                stream(input)
+                .map(add_one)
+                .filter(is_even)
+                .map(double)
+                .take_while(_is_less_than_eight)
+            )
+            assert s.collect() == [4]
+
+        def test_steps_are_lazy(self):
+            calls: list[int] = []
+            s = stream([1, 2, 3]).map(lambda x: calls.append(x) or x)
+            assert calls == []
+            assert s.collect() == [1, 2, 3]
+            assert calls == [1, 2, 3]
+
+        def test_reiterable_over_sequences(self):
+            s = stream([1, 2, 3]).map(add_one)
+            assert s.collect() == [2, 3, 4]
+            assert s.collect() == [2, 3, 4]
+
     class TestTake:
         def test_take(self, input: Iterable[int]):
-            s = stream(input).map(lambda x: x + 1).take(2)
-            assert isinstance(s, Stream)
+            s = stream(input).map(add_one).take(2)
             assert s.collect() == [2, 3]
 
+        def test_take_negative(self, input: Iterable[int]):
+            with pytest.raises(ValueError):
+                stream(input).map(add_one).take(-1)
+
+        def test_take_sequence(self):
+            assert stream([1, 2, 3]).take(2).collect() == [1, 2]
+            assert stream((1, 2, 3)).take(5).collect() == [1, 2, 3]
+            assert stream(range(10)).take(3).collect() == [0, 1, 2]
+
         def test_take_while(self):
-            s = (
-                stream(yield_range(0, 10))
-                .map(lambda x: x + 1)
-                .take_while(lambda x: x < 3)
-            )
-            assert isinstance(s, Stream)
+            s = stream(yield_range(0, 10)).map(add_one).take_while(_is_less_than_three)
             assert s.collect() == [1, 2]
 
+    class TestTap:
+        def test_tap(self, input: Iterable[int]):
+            tapped: list[int] = []
+            s = stream(input).tap(tapped.append).map(add_one)
+            assert s.collect() == [2, 3, 4]
+            assert tapped == [1, 2, 3]
+
+    class TestReduce:
+        def test_reduce(self, input: Iterable[int]):
+            s = stream(input).reduce(add, 0)
+            assert s.collect() == [6]
+            assert sum(stream(yield_range(1, 4))) == 6
+
+        def test_reduce_empty(self):
+            s = Stream[int]([]).reduce(add, 10)
+            assert s.collect() == [10]
+
+        def test_reduce_then_map(self, input: Iterable[int]):
+            s = stream(input).reduce(add, 0).map(double)
+            assert s.collect() == [12]
+
     class TestDefault:
         def test_default(self, input: Iterable[int]):
             s = stream(input).default(0)
-            assert isinstance(s, Stream)
             assert s.collect() == [1, 2, 3]
 
         def test_default_empty(self):
             s = Stream[int]([]).default(0)
-            assert isinstance(s, Stream)
             assert s.collect() == [0]
+
+        def test_default_sized(self):
+            assert stream([1, 2]).default(0).collect() == [1, 2]
+
+        def test_default_filtered_to_empty(self):
+            s = stream([1, 3]).filter(is_even).default(0)
+            assert s.collect() == [0]
+
+    class TestPrefetch:
+        def test_prefetch(self, input: Iterable[int]):
+            s = stream(input).prefetch(2).map(add_one)
+            assert s.collect() == [2, 3, 4]
+
+        def test_prefetch_unbounded(self):
+            assert stream(yield_range(0, 100)).prefetch(0).collect() == list(range(100))
+
+        def test_prefetch_raises_upstream_error(self):
+            def failing():
+                yield 1
+                raise ValueError("upstream")
+
+            s = stream(failing()).prefetch(2)
+            with pytest.raises(ValueError, match="upstream"):
+                s.collect()
+
+        def test_prefetch_stops_early(self):
+            pulled: list[int] = []
+            s = stream(yield_range(0, 1_000)).tap(pulled.append).prefetch(4).take(3)
+            assert s.collect() == [0, 1, 2]
+            for thread in threading.enumerate():
+                if thread.name == "amalfi-prefetch":
+                    thread.join()
+            assert len(pulled) <= 3 + 4 + 1
+
+    class TestParallelMap:
+        def test_pmap_threads(self, input: Iterable[int]):
+            s = stream(input).pmap(double, workers=2, mode="thread")
+            assert s.collect() == [2, 4, 6]
+
+        def test_pmap_processes(self):
+            s = stream([-1, -2, 3]).pmap(abs, workers=2, chunksize=2)
+            assert s.collect() == [1, 2, 3]
+
+        def test_pmap_raises(self):
+            def fail(x: int) -> int:
+                raise ValueError(x)
+
+            with pytest.raises(ValueError):
+                stream([1, 2]).pmap(fail, mode="thread").collect()
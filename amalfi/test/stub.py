@@ -1,5 +1,19 @@
-import asyncio
-from typing import AsyncIterator, Generator, Iterable
+import os
+from typing import AsyncIterator, Iterable, Iterator
+
+from anyio import sleep
+from anyio.lowlevel import checkpoint
+
+STUB_SLEEP = float(os.environ.get("AMALFI_STUB_SLEEP", "0"))
+"""Simulated latency of the async stubs, in seconds (eg. 0.001 to mimic I/O)."""
+
+
+async def wait() -> None:
+    """Yield to the event loop, sleeping for `STUB_SLEEP` if set."""
+    if STUB_SLEEP:
+        await sleep(STUB_SLEEP)
+    else:
+        await checkpoint()
 
 
 def add_one(x: int) -> int:
@@ -15,15 +29,24 @@ def is_even(x: int) -> bool:
 
 
 async def wait_and_add_one(x: int) -> int:
-    await asyncio.sleep(0.001)
+    await wait()
     return x + 1
 
 
 async def wait_and_double(x: int) -> int:
-    await asyncio.sleep(0.001)
+    await wait()
     return x * 2
 
 
+def multiply(x: int, y: int) -> int:
+    return x * y
+
+
+async def wait_and_multiply(x: int, y: int) -> int:
+    await wait()
+    return x * y
+
+
 def uppercase(s: str) -> str:
     return s.upper()
 
@@ -33,27 +56,35 @@ def greet(name: str) -> str:
 
 
 async def wait_and_emphasize(s: str) -> str:
-    await asyncio.sleep(0.001)
+    await wait()
     return s.upper() + "!"
 
 
-def yield_items[T](iterable: Iterable[T]) -> Generator[T, None, None]:
+def yield_items[T](iterable: Iterable[T]) -> Iterator[T]:
+    return iter(iterable)
+
+
+async def ayield_items[T](iterable: Iterable[T]) -> AsyncIterator[T]:
     for item in iterable:
         yield item
 
 
 async def wait_and_yield[T](iterable: Iterable[T]) -> AsyncIterator[T]:
     for item in iterable:
-        await asyncio.sleep(0.001)
+        await wait()
         yield item
 
 
-def yield_range(start: int, end: int) -> Generator[int, None, None]:
-    for i in range(start, end):
-        yield i
+def yield_range(start: int, end: int) -> Iterator[int]:
+    return iter(range(start, end))
 
 
 async def ayield_range(start: int, end: int) -> AsyncIterator[int]:
     for i in range(start, end):
-        await asyncio.sleep(0.001)
         yield i
+
+
+async def apairs(pairs: Iterable[tuple[int, int]]) -> AsyncIterator[tuple[int, int]]:
+    for pair in pairs:
+        await wait()
+        yield pair
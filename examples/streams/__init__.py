@@ -1,8 +1,12 @@
 from amalfi.stream import stream
 
 
+def multiply_by_two(x: int) -> int:
+    return x * 2
+
+
 def main():
-    s = stream(range(10)).map(lambda x: x * 2)
+    s = stream(range(10)).map(multiply_by_two)
     print(s)
 
 